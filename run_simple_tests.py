@@ -7,9 +7,15 @@ for verifying basic functionality.
 """
 
 import sys
-import os
-import traceback
 import numpy as np
+from pathlib import Path
+
+# Random test data is sliced from this pool instead of drawn per test
+_RNG = np.random.default_rng(42)
+_POOL = np.empty((256, 256), dtype=np.float32)
+_RNG.random(out=_POOL, dtype=np.float32)
+np.multiply(_POOL, 1000, out=_POOL)
+_POOL.flags.writeable = False
 
 def setup_test_environment():
     """Set up the test environment and parameters"""
@@ -21,13 +27,9 @@ def setup_test_environment():
         print("✅ WFIRST parameters loaded")
         
         # Ensure directories exist
-        if not os.path.exists(par.exportDir):
-            os.makedirs(par.exportDir)
-            print(f"✅ Created export directory: {par.exportDir}")
-        
-        if not os.path.exists(par.unitTestsOutputs):
-            os.makedirs(par.unitTestsOutputs)
-            print(f"✅ Created output directory: {par.unitTestsOutputs}")
+        Path(par.exportDir).mkdir(parents=True, exist_ok=True)
+        Path(par.unitTestsOutputs).mkdir(parents=True, exist_ok=True)
+        print(f"✅ Output directories ready: {par.exportDir}, {par.unitTestsOutputs}")
         
         return par
     except Exception as e:
@@ -53,7 +55,7 @@ def test_basic_functionality(par):
         from crispy.tools.image import Image
         
         # Test 1: Create Image object
-        test_data = np.random.rand(64, 64) * 1000
+        test_data = np.full((64, 64), 500.0, dtype=np.float32)
         img = Image(data=test_data)
         print("✅ Image object creation")
         
@@ -82,8 +84,8 @@ def test_parameter_loading(par):
         for config in configs:
             try:
                 if config == 'WFIRST':
-                    from crispy.WFIRST import params
-                    test_par = params.Params(codeRoot='./crispy')
+                    # Already built by setup_test_environment
+                    test_par = par
                 elif config == 'PISCES':
                     from crispy.PISCES import params
                     test_par = params.Params(codeRoot='./crispy')
@@ -124,10 +126,9 @@ def test_working_units(par):
         )
         results["testCrosstalk"] = success
         
-        # Test 3: testOptExt
+        # Test 3: testOptExt (wraps a view of the shared pool, no copy)
         try:
-            test_data = np.random.rand(100, 100) * 1000
-            test_image = Image(data=test_data)
+            test_image = Image(data=_POOL[:100, :100])
             success, result = run_test_safely(
                 testOptExt, "testOptExt", par, test_image, lensX=0, lensY=0
             )
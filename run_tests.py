@@ -5,18 +5,34 @@ CRISPY Modern Test Runner 🚀
 Convenient wrapper for running pytest with commonly used options and emojis!
 """
 
+import os
 import sys
 import subprocess
 import argparse
+import compileall
+import importlib.util
 from pathlib import Path
 
+import pytest
+
 
 def run_pytest(args):
-    """Run pytest with the given arguments"""
-    cmd = ["pytest"] + args
-    print(f"🏃‍♂️ Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
-    return result.returncode
+    """Run pytest in-process with the given arguments"""
+    print(f"🏃‍♂️ Running: pytest {' '.join(args)}")
+    return int(pytest.main(args))
+
+
+def report_coverage():
+    """Combine per-worker coverage data and print the reports, returning an exit code"""
+    # -i skips source files coverage cannot parse (e.g. the Python 2 tools/diagnose.py)
+    steps = [["report", "-i"], ["html", "-i"]]
+    if list(Path(".").glob(".coverage.*")):
+        steps.insert(0, ["combine"])
+    for step in steps:
+        returncode = subprocess.run([sys.executable, "-m", "coverage"] + step).returncode
+        if returncode != 0:
+            return returncode
+    return 0
 
 
 def main():
@@ -24,13 +40,18 @@ def main():
         description="🧪 CRISPY Modern Test Runner with Beautiful Output",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
+Setup:
+  pip install -e .[test]                 # Install crispy and all test dependencies
+
 Examples:
   python run_tests.py                    # Run all tests
   python run_tests.py --unit             # Unit tests only  
   python run_tests.py --working          # Working tests only
   python run_tests.py --fast             # Fast tests (no slow ones)
   python run_tests.py --coverage         # With coverage report
-  python run_tests.py --parallel         # Run in parallel
+  python run_tests.py --no-parallel      # Run serially (parallel is the default)
+  python run_tests.py --workers 4        # Run on 4 workers
+  python run_tests.py --low-memory       # Single-threaded workers for memory-constrained CI
   python run_tests.py --experimental     # Include experimental tests
         """
     )
@@ -45,7 +66,10 @@ Examples:
     
     # Output options
     parser.add_argument("--coverage", action="store_true", help="📊 Generate coverage report")
-    parser.add_argument("--parallel", action="store_true", help="🏃‍♂️ Run tests in parallel")
+    parser.add_argument("--parallel", action="store_true", default=True, help="🏃‍♂️ Run tests in parallel (default)")
+    parser.add_argument("--no-parallel", dest="parallel", action="store_false", help="🐢 Run tests serially")
+    parser.add_argument("--workers", type=int, help="👷 Number of parallel workers (default: auto)")
+    parser.add_argument("--low-memory", action="store_true", help="🪶 One BLAS/OpenMP thread per worker")
     parser.add_argument("--quiet", action="store_true", help="🤫 Quiet output")
     parser.add_argument("--verbose", action="store_true", help="📝 Verbose output")
     
@@ -54,42 +78,57 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.workers is not None and not args.parallel:
+        parser.error("--workers cannot be combined with --no-parallel")
+    if args.low_memory and not args.parallel:
+        parser.error("--low-memory cannot be combined with --no-parallel")
+    
+    if args.parallel and importlib.util.find_spec("xdist") is None:
+        print("⚠️ pytest-xdist not installed, running serially (pip install -e .[test])")
+        args.parallel = False
+    
     # Build pytest command
     pytest_args = []
     
     # Test selection
+    markers = []
     if args.unit:
-        pytest_args.extend(["-m", "unit"])
+        markers.append("unit")
     elif args.integration:
-        pytest_args.extend(["-m", "integration"]) 
+        markers.append("integration")
     elif args.working:
-        pytest_args.extend(["-m", "working"])
+        markers.append("working")
     elif args.data:
-        pytest_args.extend(["-m", "requires_data"])
+        markers.append("requires_data")
     
     # Experimental tests (usually excluded by default)
     if not args.experimental:
-        if any(m in pytest_args for m in ["-m"]):
-            # Already have a marker, combine with 'and not experimental'
-            idx = pytest_args.index("-m") + 1
-            pytest_args[idx] = pytest_args[idx] + " and not experimental"
-        else:
-            pytest_args.extend(["-m", "not experimental"])
+        markers.append("not experimental")
     
     # Speed options
     if args.fast:
-        if any(m in pytest_args for m in ["-m"]):
-            idx = pytest_args.index("-m") + 1
-            pytest_args[idx] = pytest_args[idx] + " and not slow"
-        else:
-            pytest_args.extend(["-m", "not slow"])
+        markers.append("not slow")
+    
+    if markers:
+        pytest_args.extend(["-m", " and ".join(markers)])
     
     # Output options
-    if args.coverage:
-        pytest_args.extend(["--cov=crispy", "--cov-report=html", "--cov-report=term"])
+    if args.coverage and args.parallel:
+        # Workers only record data; reports are built once after the run
+        pytest_args.extend(["--cov=crispy", "--cov-report=", "--cov-context=test", "--no-cov-on-fail"])
+    elif args.coverage:
+        pytest_args.extend(["--cov=crispy", "--cov-report=html", "--cov-report=term", "--no-cov-on-fail"])
     
     if args.parallel:
-        pytest_args.extend(["-n", "auto"])
+        # loadgroup keeps xdist_group tests that write shared output files on one worker
+        pytest_args.extend(["-n", str(args.workers) if args.workers else "auto", "--dist", "loadgroup"])
+        if args.low_memory:
+            # Workers inherit this environment; stop numpy/scipy thread pools oversubscribing cores
+            for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+                os.environ[var] = "1"
+    
+    if os.environ.get("CI"):
+        pytest_args.extend(["-p", "no:cacheprovider"])
     
     if args.verbose:
         pytest_args.append("-v")
@@ -104,9 +143,16 @@ Examples:
     print("🎯 CRISPY Modern Test Runner")
     print("=" * 50)
     
+    # Compile crispy's bytecode up front so parallel workers don't all compile it
+    if args.parallel:
+        compileall.compile_dir(Path(__file__).resolve().parent / "crispy", quiet=2)
+    
     # Run pytest
     exit_code = run_pytest(pytest_args)
     
+    if args.coverage and args.parallel and exit_code == 0:
+        exit_code = report_coverage()
+    
     # Print footer
     print("=" * 50)
     if exit_code == 0:
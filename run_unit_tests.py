@@ -18,6 +18,7 @@ For more options, use the modern test runners:
 
 import sys
 import subprocess
+import importlib.util
 
 def main():
     print("🔄 CRISPY Unit Test Runner (Legacy)")
@@ -26,26 +27,28 @@ def main():
     print("🚀 Redirecting to modern pytest framework...")
     print()
     
-    # Run pytest with unit test focus
+    if importlib.util.find_spec("pytest") is None:
+        print("❌ pytest not found. Please install the test dependencies:")
+        print("   pip install -e .[test]")
+        return 1
+    
+    # Run pytest with unit test focus, in the same interpreter that checked for xdist
     pytest_args = [
-        "pytest", 
+        sys.executable, "-m", "pytest",
         "-v",                    # Verbose output
         "-m", "unit",           # Unit tests only
         "--tb=short"            # Shorter traceback format
     ]
     
+    # The unit tests are independent, so spread them over all cores
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args.extend(["-n", "auto", "--dist", "loadgroup"])
+    
     print(f"Running: {' '.join(pytest_args)}")
     print("=" * 50)
     
-    try:
-        result = subprocess.run(pytest_args)
-        return result.returncode
-    except FileNotFoundError:
-        print("❌ pytest not found. Please install pytest:")
-        print("   conda install pytest")
-        print("   # or")
-        print("   pip install pytest")
-        return 1
+    result = subprocess.run(pytest_args)
+    return result.returncode
 
 if __name__ == "__main__":
     exit_code = main()
@@ -2,12 +2,7 @@
 import os
 import sys
 
-try:
-    from setuptools import setup
-    setup
-except ImportError:
-    from distutils.core import setup
-    setup
+from setuptools import setup, find_packages
 
 
 setup(
@@ -16,7 +11,7 @@ setup(
     author='Maxime Rizzo',
     author_email = 'maxime.j.rizzo@nasa.gov',
     url = 'https://github.com/mjrfringes/crispy',
-    packages =['crispy','crispy.tools'],
+    packages = find_packages(exclude=['tests', 'tests.*']),
     license = 'GNU GPLv3',
     description ='The Coronagraph and Rapid Imaging Spectrograph in Python',
     package_dir = {"crispy":'crispy', "crispy.tools":'crispy/tools'},
@@ -41,4 +36,7 @@ setup(
         'astropy>=4.0',
         'photutils>=1.0.0'
     ],
+    extras_require = {
+        'test': ['pytest', 'pytest-xdist', 'pytest-cov', 'filelock'],
+    },
 )
@@ -4,39 +4,17 @@ Simple test script to verify the CRISPY environment is working properly
 """
 
 import sys
+import importlib
 print(f"Python version: {sys.version}")
 print("Testing imports...")
 
 # Test basic scientific libraries
-try:
-    import numpy as np
-    print("✅ NumPy:", np.__version__)
-except ImportError as e:
-    print("❌ NumPy:", str(e))
-
-try:
-    import scipy
-    print("✅ SciPy:", scipy.__version__)
-except ImportError as e:
-    print("❌ SciPy:", str(e))
-
-try:
-    import matplotlib
-    print("✅ Matplotlib:", matplotlib.__version__)
-except ImportError as e:
-    print("❌ Matplotlib:", str(e))
-
-try:
-    import astropy
-    print("✅ Astropy:", astropy.__version__)
-except ImportError as e:
-    print("❌ Astropy:", str(e))
-
-try:
-    import photutils
-    print("✅ Photutils:", photutils.__version__)
-except ImportError as e:
-    print("❌ Photutils:", str(e))
+for name, module in [("NumPy", "numpy"), ("SciPy", "scipy"), ("Matplotlib", "matplotlib"),
+                     ("Astropy", "astropy"), ("Photutils", "photutils")]:
+    try:
+        print(f"✅ {name}:", importlib.import_module(module).__version__)
+    except ImportError as e:
+        print(f"❌ {name}:", str(e))
 
 # Test CRISPY specific imports
 try:
@@ -61,18 +39,14 @@ except Exception as e:
 # Test photutils specific imports
 try:
     from photutils.detection import DAOStarFinder
-    print("✅ DAOStarFinder imported")
-except ImportError as e:
-    print("❌ DAOStarFinder:", str(e))
-
-try:
     from photutils.centroids import centroid_com
-    print("✅ centroid_com imported")
+    print("✅ DAOStarFinder and centroid_com imported")
 except ImportError as e:
-    print("❌ centroid_com:", str(e))
+    print("❌ photutils stack:", str(e))
 
 # Test creating a simple image
 try:
+    import numpy as np
     data = np.random.rand(10, 10)
     img = Image(data=data)
     print("✅ Image object created successfully")
@@ -6,13 +6,31 @@ This module provides pytest fixtures and configuration for the CRISPY test suite
 
 import os
 import sys
+import copy
+import pickle
 import pytest
 import numpy as np
 from pathlib import Path
 
-# Add crispy to path for imports
+try:
+    from filelock import FileLock
+except ImportError:  # Only needed to coordinate xdist workers (pip install -e .[test])
+    FileLock = None
+
+# crispy itself is imported from the installed package (pip install -e .[test])
 crispy_root = Path(__file__).parent.parent
-sys.path.insert(0, str(crispy_root))
+
+# Tests that check for the reference data themselves and must not be skipped for its absence
+_REFDATA_CHECKS = ("test_reference_files_exist",)
+
+def _refdata_available():
+    """Whether the WFIRST wavecalDir exists, or None if the Params cannot be built"""
+    try:
+        from crispy.WFIRST import params
+        par = params.Params(codeRoot=str(crispy_root / "crispy"))
+    except Exception:
+        return None  # Left to the reference_files_available fixture at runtime
+    return os.path.isdir(par.wavecalDir)
 
 @pytest.fixture(scope="session")
 def crispy_root_dir():
@@ -24,72 +42,191 @@ def test_data_dir():
     """Return the path to test data directory"""
     return Path(__file__).parent / "fixtures"
 
+def _ensure_output_dirs(par):
+    """Create the output directories; exist_ok makes this safe across xdist workers"""
+    os.makedirs(par.exportDir, exist_ok=True)
+    os.makedirs(par.unitTestsOutputs, exist_ok=True)
+
+def _shared_run_dir(tmp_path_factory):
+    """Per-run temp directory shared by all xdist workers, or None if not usable"""
+    if "PYTEST_XDIST_WORKER" not in os.environ or FileLock is None:
+        return None
+    return tmp_path_factory.getbasetemp().parent
+
+def _load_params_cached(params, name, tmp_path_factory):
+    """Build a Params object once per run and share it with the other xdist workers"""
+    codeRoot = str(crispy_root / "crispy")
+    run_dir = _shared_run_dir(tmp_path_factory)
+    if run_dir is None:
+        return params.Params(codeRoot=codeRoot)
+    
+    cache_path = run_dir / f"crispy_{name}_params.pkl"
+    try:
+        with FileLock(str(cache_path) + '.lock'):
+            if cache_path.is_file():
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            par = params.Params(codeRoot=codeRoot)
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(par, f)
+            except Exception:
+                cache_path.unlink(missing_ok=True)  # Unpicklable; other workers build their own
+            return par
+    except Exception:
+        # Unusable lock or unreadable cache: building directly is always correct
+        return params.Params(codeRoot=codeRoot)
+
 @pytest.fixture(scope="session")
-def wfirst_params():
+def wfirst_params(tmp_path_factory):
     """Load WFIRST parameters for testing"""
     try:
         from crispy.WFIRST import params
-        par = params.Params(codeRoot=str(crispy_root / "crispy"))
+        par = _load_params_cached(params, "wfirst", tmp_path_factory)
         
-        # Ensure output directories exist
-        os.makedirs(par.exportDir, exist_ok=True)
-        os.makedirs(par.unitTestsOutputs, exist_ok=True)
+        _ensure_output_dirs(par)
         
         return par
     except Exception as e:
         pytest.skip(f"Cannot load WFIRST parameters: {e}")
 
 @pytest.fixture(scope="session")
-def pisces_params():
+def pisces_params(tmp_path_factory):
     """Load PISCES parameters for testing"""
     try:
         from crispy.PISCES import params
-        par = params.Params(codeRoot=str(crispy_root / "crispy"))
+        par = _load_params_cached(params, "pisces", tmp_path_factory)
         
-        # Ensure output directories exist
-        os.makedirs(par.exportDir, exist_ok=True)
-        os.makedirs(par.unitTestsOutputs, exist_ok=True)
+        _ensure_output_dirs(par)
         
         return par
     except Exception as e:
         pytest.skip(f"Cannot load PISCES parameters: {e}")
 
-@pytest.fixture
-def sample_image_data():
-    """Generate sample image data for testing"""
-    return np.random.rand(64, 64) * 1000
+@pytest.fixture(scope="session")
+def rng():
+    """Seeded random Generator shared by the whole test session"""
+    return np.random.default_rng(42)
+
+@pytest.fixture(scope="session")
+def _rand_pool(rng):
+    """Pre-generated random values that the data fixtures slice views from"""
+    pool = np.empty((256, 256), dtype=np.float32)
+    rng.random(out=pool, dtype=np.float32)
+    np.multiply(pool, 1000.0, out=pool)
+    # Every data fixture hands out views of this buffer, so in-place writes must fail loudly
+    pool.flags.writeable = False
+    return pool
 
 @pytest.fixture
-def large_sample_image_data():
-    """Generate larger sample image data for testing"""
-    return np.random.rand(100, 100) * 1000
+def sample_image_data(_rand_pool):
+    """Generate sample image data for testing"""
+    return _rand_pool[:64, :64]
 
 @pytest.fixture
-def sample_spectrum_data():
+def sample_spectrum_data(_rand_pool):
     """Generate sample spectrum data for testing"""
     wavelengths = np.linspace(600, 900, 50)  # nm
-    flux = np.random.rand(50) * 1000
+    flux = _rand_pool[-1, :50]
     return wavelengths, flux
 
-@pytest.fixture
-def crispy_image():
-    """Create a CRISPY Image object for testing"""
+@pytest.fixture(scope="session")
+def crispy_image(_rand_pool):
+    """Create a CRISPY Image object shared by tests that only read it"""
     try:
         from crispy.tools.image import Image
-        data = np.random.rand(64, 64) * 1000
-        return Image(data=data)
+        return Image(data=_rand_pool[:64, :64].copy())
     except ImportError:
         pytest.skip("Cannot import CRISPY Image class")
 
+@pytest.fixture(scope="module")
+def large_image(_rand_pool):
+    """Read-only CRISPY Image wrapping the large pool slice without copying it"""
+    try:
+        from crispy.tools.image import Image
+        return Image(data=_rand_pool[:100, :100])
+    except ImportError:
+        pytest.skip("Cannot import CRISPY Image class")
+
+@pytest.fixture(scope="session")
+def unit_test_funcs():
+    """Import crispy.unitTests once per session and share the module"""
+    try:
+        from crispy import unitTests
+        return unitTests
+    except ImportError as e:
+        pytest.skip(f"Cannot import crispy.unitTests: {e}")
+
+class _PathCache(dict):
+    """Maps path -> check(path), statting each path only once"""
+    
+    def __init__(self, check):
+        super().__init__()
+        self.check = check
+    
+    def __missing__(self, path):
+        self[path] = self.check(path)
+        return self[path]
+
+@pytest.fixture(scope="session")
+def path_exists():
+    """Session-wide cache of path existence checks for paths tests don't create"""
+    return _PathCache(os.path.exists)
+
 @pytest.fixture(scope="session")
-def reference_files_available(wfirst_params):
+def path_is_dir():
+    """Session-wide cache of directory checks for paths tests don't create"""
+    return _PathCache(lambda path: Path(path).is_dir())
+
+@pytest.fixture(scope="session")
+def reference_files_available(wfirst_params, path_is_dir):
     """Check if reference files are available"""
-    if not os.path.exists(wfirst_params.wavecalDir):
+    if not path_is_dir[wfirst_params.wavecalDir]:
         pytest.skip("Reference files not available for testing")
     return True
 
+@pytest.fixture(scope="session")
+def lamsol(wfirst_params, tmp_path_factory):
+    """Load the wavelength solution once, returning (lamlist, allcoef)
+    
+    Under xdist the first worker converts lamsol.dat to a binary copy in the
+    per-run temp directory, and the other workers memory-map that instead
+    of parsing the text file again.
+    """
+    src = os.path.join(wfirst_params.wavecalDir, "lamsol.dat")
+    run_dir = _shared_run_dir(tmp_path_factory)
+    arr = None
+    if run_dir is not None:
+        cache = run_dir / "lamsol.npy"
+        try:
+            with FileLock(str(cache) + '.lock'):
+                if not cache.is_file():
+                    np.save(cache, np.loadtxt(src))
+            arr = np.load(cache, mmap_mode='r')
+        except Exception:
+            arr = None  # Fall back to parsing the text file below
+    if arr is None:
+        arr = np.loadtxt(src)
+    return arr[:, 0], arr[:, 1:]
+
+@pytest.fixture(scope="session")
+def psftool(lamsol):
+    """PSFLets with the interpolation array already set up; treat as read-only"""
+    from crispy.tools.locate_psflets import PSFLets
+    tool = PSFLets()
+    lamlist, allcoef = lamsol
+    tool.geninterparray(lamlist, allcoef)
+    return tool
+
+@pytest.fixture
+def psftool_copy(psftool):
+    """Private copy of psftool for tests that go on to mutate it"""
+    return copy.deepcopy(psftool)
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically"""
+    refdata_available = None
+    probed = False
     for item in items:
         # Add markers based on test location
         if "unit" in str(item.fspath):
@@ -100,6 +237,13 @@ def pytest_collection_modifyitems(config, items):
         # Add marker for tests that require data files
         if any(keyword in item.name.lower() for keyword in ["kernel", "cutout", "wavecal", "flatfield"]):
             item.add_marker(pytest.mark.requires_data)
+        
+        if not item.get_closest_marker("requires_data") or item.originalname in _REFDATA_CHECKS:
+            continue
+        if not probed:
+            refdata_available, probed = _refdata_available(), True
+        if refdata_available is False:
+            item.add_marker(pytest.mark.skip(reason="reference data missing"))
 
 def pytest_configure(config):
     """Configure pytest with custom settings"""
@@ -110,26 +254,28 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "requires_data: Tests requiring reference data")
     config.addinivalue_line("markers", "working: Tests known to work")
     config.addinivalue_line("markers", "experimental: Experimental tests")
+    config.addinivalue_line("markers", "xdist_group(name): Run on the same xdist worker as other tests in the group")
+
+# Test result emoji mapping, written out once at the end of the session
+_OUTCOME_EMOJI = {'passed': "✅", 'failed': "❌", 'skipped': "⏭️"}
+_emoji_buf = []
 
-# Test result emoji mapping
 def pytest_runtest_logreport(report):
     """Add emoji to test results"""
-    if hasattr(report, 'outcome'):
-        if report.outcome == 'passed':
-            print("✅", end="")
-        elif report.outcome == 'failed':
-            print("❌", end="")
-        elif report.outcome == 'skipped':
-            print("⏭️", end="")
+    emoji = _OUTCOME_EMOJI.get(getattr(report, 'outcome', None))
+    if emoji:
+        _emoji_buf.append(emoji)
 
 # Session start/end hooks for better output
 def pytest_sessionstart(session):
     """Print session start message"""
+    _emoji_buf.clear()
     print("\n🚀 Starting CRISPY Test Suite")
     print("=" * 50)
 
 def pytest_sessionfinish(session, exitstatus):
     """Print session end message with emoji summary"""
+    sys.stdout.write("".join(_emoji_buf))
     print("\n" + "=" * 50)
     print("📊 Test Session Complete!")
     
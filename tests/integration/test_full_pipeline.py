@@ -6,7 +6,19 @@ Full pipeline tests that verify complete workflows work end-to-end.
 
 import pytest
 import numpy as np
-import os
+
+pytest.importorskip("crispy")
+
+from crispy.tools.image import Image
+from crispy.tools.locate_psflets import PSFLets
+from crispy.tools.reduction import calculateWaveList
+
+# Invalid Image inputs, allocated once at import
+_INVALID_INPUTS = [
+    np.empty(0),  # Empty array
+    np.ones((1, 2, 2)),  # Wrong dimensions
+    np.full((10, 10), np.nan),  # All NaN
+]
 
 
 class TestBasicWorkflow:
@@ -17,9 +29,6 @@ class TestBasicWorkflow:
     @pytest.mark.slow
     def test_minimal_ifs_workflow(self, wfirst_params, reference_files_available):
         """Test minimal IFS workflow from parameters to output 🌟"""
-        from crispy.tools.image import Image
-        from crispy.tools.reduction import calculateWaveList
-        
         # Step 1: Calculate wavelength list
         try:
             lam_midpts, lam_endpts = calculateWaveList(wfirst_params, Nspec=5, method='optext')
@@ -28,12 +37,12 @@ class TestBasicWorkflow:
         except Exception as e:
             pytest.skip(f"Wavelength calculation failed: {e}")
         
-        # Step 2: Create simple input cube
+        # Step 2: Create the first slice of a flat input cube
         npix = 32  # Small for speed
-        inputCube = np.ones((len(lam_midpts), npix, npix), dtype=np.float32)
+        slice0 = np.ones((npix, npix), dtype=np.float32)
         
         # Step 3: Create Image object
-        test_image = Image(data=inputCube[0])  # Just first wavelength slice
+        test_image = Image(data=slice0)  # Just first wavelength slice
         assert test_image.data.shape == (npix, npix)
         
         # If we get here, basic workflow components work
@@ -41,25 +50,23 @@ class TestBasicWorkflow:
     
     @pytest.mark.integration
     @pytest.mark.requires_data
-    def test_parameter_to_output_chain(self, wfirst_params, reference_files_available):
+    def test_parameter_to_output_chain(self, wfirst_params, reference_files_available, lamsol, path_exists):
         """Test the parameter → processing → output chain 🔗"""
         # Test that we can go from parameters to creating output files
         
         # Step 1: Verify parameters
         assert wfirst_params.wavecalDir
-        assert os.path.exists(wfirst_params.wavecalDir)
+        assert path_exists[wfirst_params.wavecalDir]
         
         # Step 2: Verify output directory creation
         assert wfirst_params.exportDir
-        assert os.path.exists(wfirst_params.exportDir)
+        assert path_exists[wfirst_params.exportDir]
         
         # Step 3: Test we can load reference data
-        lamsol_file = os.path.join(wfirst_params.wavecalDir, "lamsol.dat")
-        data = np.loadtxt(lamsol_file)
-        assert data.shape[0] > 0
+        lamlist, allcoef = lamsol
+        assert len(lamlist) > 0
         
         # Step 4: Test basic processing components
-        from crispy.tools.locate_psflets import PSFLets
         psftool = PSFLets()
         assert psftool is not None
         
@@ -85,7 +92,7 @@ class TestMultiConfiguration:
     
     @pytest.mark.integration
     @pytest.mark.requires_data
-    def test_configuration_file_consistency(self, wfirst_params, pisces_params):
+    def test_configuration_file_consistency(self, wfirst_params, pisces_params, path_exists):
         """Test that configuration files are internally consistent 🔍"""
         configs = [
             ("WFIRST", wfirst_params),
@@ -101,7 +108,7 @@ class TestMultiConfiguration:
             
             # Test directory paths exist (when they should)
             if hasattr(params, 'exportDir') and params.exportDir:
-                assert os.path.exists(params.exportDir), f"{name}: exportDir should exist"
+                assert path_exists[params.exportDir], f"{name}: exportDir should exist"
 
 
 class TestEndToEndScenarios:
@@ -110,14 +117,12 @@ class TestEndToEndScenarios:
     @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.requires_data
-    def test_create_and_process_small_dataset(self, wfirst_params, reference_files_available):
+    @pytest.mark.xdist_group("unittestsoutputs")  # Writes flatfield_input.fits
+    def test_create_and_process_small_dataset(self, unit_test_funcs, wfirst_params, crispy_image, reference_files_available):
         """Test creating and processing a small synthetic dataset 📊"""
-        from crispy.tools.image import Image
-        from crispy.unitTests import testCreateFlatfield, testOptExt
-        
         # Step 1: Create a small flatfield (this should work)
         try:
-            testCreateFlatfield(
+            unit_test_funcs.testCreateFlatfield(
                 wfirst_params,
                 pixsize=0.1,
                 npix=32,
@@ -130,10 +135,7 @@ class TestEndToEndScenarios:
         
         # Step 2: Process with optimal extraction
         try:
-            test_data = np.random.rand(64, 64) * 1000
-            test_image = Image(data=test_data)
-            
-            outspec, outvar = testOptExt(wfirst_params, test_image, lensX=0, lensY=0)
+            outspec, outvar = unit_test_funcs.testOptExt(wfirst_params, crispy_image, lensX=0, lensY=0)
             
             assert outspec is not None
             assert outvar is not None
@@ -147,23 +149,17 @@ class TestEndToEndScenarios:
     
     @pytest.mark.integration
     @pytest.mark.requires_data
-    def test_reference_data_workflow(self, wfirst_params, reference_files_available):
+    def test_reference_data_workflow(self, wfirst_params, reference_files_available, lamsol, psftool):
         """Test workflow using actual reference data 📚"""
-        from crispy.tools.locate_psflets import PSFLets
-        
         # Load reference data
-        lamlist = np.loadtxt(wfirst_params.wavecalDir + "lamsol.dat")[:, 0]
-        allcoef = np.loadtxt(wfirst_params.wavecalDir + "lamsol.dat")[:, 1:]
+        lamlist, allcoef = lamsol
         
         assert len(lamlist) > 0
         assert allcoef.shape[0] == len(lamlist)
         assert allcoef.shape[1] > 0
         
-        # Process with PSFLets
-        psftool = PSFLets()
-        psftool.geninterparray(lamlist, allcoef)
-        
-        # geninterparray should set up the interpolation array, not lam_indx
+        # The psftool fixture has been through geninterparray, which should
+        # set up the interpolation array, not lam_indx
         assert psftool.interp_arr is not None
         assert psftool.order is not None
         assert psftool.interp_arr.shape[0] == psftool.order + 1
@@ -188,25 +184,13 @@ class TestErrorHandling:
             assert "not found" in str(e).lower() or "no such file" in str(e).lower()
     
     @pytest.mark.integration
-    def test_invalid_data_handling(self, wfirst_params):
+    @pytest.mark.parametrize("invalid_data", _INVALID_INPUTS, ids=["empty", "3d", "nan"])
+    def test_invalid_data_handling(self, wfirst_params, invalid_data):
         """Test handling of invalid input data 📉"""
-        from crispy.tools.image import Image
-        
-        # Test with various invalid inputs
-        invalid_data_sets = [
-            np.array([]),  # Empty array
-            np.array([[[1, 2], [3, 4]]]),  # Wrong dimensions
-            np.full((10, 10), np.nan),  # All NaN
-        ]
-        
-        for invalid_data in invalid_data_sets:
-            try:
-                img = Image(data=invalid_data)
-                # If it creates successfully, that's okay too
-                assert img.data is not None
-            except Exception:
-                # Expected to fail with invalid data
-                pass
-        
-        # Test should complete without crashing
-        assert True
\ No newline at end of file
+        try:
+            img = Image(data=invalid_data)
+            # If it creates successfully, that's okay too
+            assert img.data is not None
+        except Exception:
+            # Expected to fail with invalid data
+            pass
\ No newline at end of file
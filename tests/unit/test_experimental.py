@@ -7,6 +7,15 @@ These tests cover functionality that has known issues but we want to track progr
 import pytest
 import numpy as np
 
+# Image sizes exercised by test_cutout_size
+CUTOUT_SIZES = (50, 64, 80, 100, 128)
+
+
+@pytest.fixture(scope="module")
+def random_images(_rand_pool):
+    """Square random images keyed by size, sliced from the session pool"""
+    return {size: _rand_pool[:size, :size] for size in CUTOUT_SIZES}
+
 
 class TestKernelLoading:
     """Test kernel loading functionality (known issues) ⚠️"""
@@ -14,12 +23,10 @@ class TestKernelLoading:
     @pytest.mark.experimental
     @pytest.mark.requires_data
     @pytest.mark.slow
-    def test_load_kernels_basic(self, wfirst_params, reference_files_available):
+    def test_load_kernels_basic(self, unit_test_funcs, wfirst_params, reference_files_available):
         """Test basic kernel loading (may fail due to slice indices issue) 🔧"""
-        from crispy.unitTests import testLoadKernels
-        
         try:
-            testLoadKernels(wfirst_params)
+            unit_test_funcs.testLoadKernels(wfirst_params)
             assert True, "Kernel loading worked!"
         except TypeError as e:
             if "slice indices must be integers" in str(e):
@@ -35,12 +42,10 @@ class TestCutoutFunctionality:
     
     @pytest.mark.experimental
     @pytest.mark.requires_data
-    def test_cutout_with_synthetic_data(self, wfirst_params, sample_image_data, reference_files_available):
+    def test_cutout_with_synthetic_data(self, unit_test_funcs, wfirst_params, sample_image_data, reference_files_available):
         """Test cutout function with synthetic data (known broadcasting issues) 🖼️"""
-        from crispy.unitTests import testCutout
-        
         try:
-            result = testCutout(wfirst_params, sample_image_data, lensX=0, lensY=0, dy=2.5)
+            result = unit_test_funcs.testCutout(wfirst_params, sample_image_data, lensX=0, lensY=0, dy=2.5)
             subim, psflet_subarr, bounds = result
             
             assert subim is not None
@@ -57,32 +62,12 @@ class TestCutoutFunctionality:
     
     @pytest.mark.experimental
     @pytest.mark.requires_data
-    def test_cutout_different_sizes(self, wfirst_params, reference_files_available):
+    @pytest.mark.xfail(raises=ValueError, reason="Known issue: array broadcasting problem", strict=False)
+    @pytest.mark.parametrize("size", CUTOUT_SIZES)
+    def test_cutout_size(self, unit_test_funcs, wfirst_params, random_images, reference_files_available, size):
         """Test cutout with different image sizes 📏"""
-        from crispy.unitTests import testCutout
-        
-        # Try different image sizes to see if we can find one that works
-        sizes = [50, 64, 80, 100, 128]
-        
-        for size in sizes:
-            try:
-                test_data = np.random.rand(size, size) * 1000
-                result = testCutout(wfirst_params, test_data, lensX=0, lensY=0, dy=2.5)
-                
-                # If we get here, this size worked
-                assert result is not None
-                pytest.skip(f"Cutout works with size {size}x{size}")
-                return
-                
-            except ValueError as e:
-                if "could not broadcast input array" in str(e):
-                    continue  # Try next size
-                else:
-                    raise
-            except Exception:
-                continue  # Try next size
-        
-        pytest.skip("All tested sizes failed with broadcasting issues")
+        result = unit_test_funcs.testCutout(wfirst_params, random_images[size], lensX=0, lensY=0, dy=2.5)
+        assert result is not None
 
 
 class TestFitCutout:
@@ -90,12 +75,10 @@ class TestFitCutout:
     
     @pytest.mark.experimental
     @pytest.mark.requires_data
-    def test_fit_cutout_basic(self, wfirst_params, sample_image_data, reference_files_available):
+    def test_fit_cutout_basic(self, unit_test_funcs, wfirst_params, sample_image_data, reference_files_available):
         """Test fit cutout functionality 🎯"""
-        from crispy.unitTests import testFitCutout
-        
         try:
-            result = testFitCutout(
+            result = unit_test_funcs.testFitCutout(
                 wfirst_params, 
                 sample_image_data,
                 lensX=0, 
@@ -121,7 +104,10 @@ class TestImageOperations:
         try:
             img_copy = crispy_image.copy()
             assert img_copy is not None
-            assert np.array_equal(img_copy.data, crispy_image.data)
+            assert img_copy.data.shape == crispy_image.data.shape
+            assert img_copy.data.dtype == crispy_image.data.dtype
+            assert img_copy.data is not crispy_image.data
+            np.testing.assert_array_equal(img_copy.data, crispy_image.data)
             assert img_copy is not crispy_image  # Different objects
             
         except AttributeError as e:
@@ -153,22 +139,22 @@ class TestParameterConsistency:
             'pinhole', 'prefix', 'npix', 'pixsize'
         ]
         
-        missing_attrs = []
-        for attr in expected_attrs:
-            if not hasattr(wfirst_params, attr):
-                missing_attrs.append(attr)
-        
-        if missing_attrs:
-            pytest.fail(f"Missing parameters: {missing_attrs}")
-        
-        assert True, "All expected parameters present"
+        # dir() also covers class-level attributes, like hasattr did
+        names = set(dir(wfirst_params))
+        missing_attrs = [attr for attr in expected_attrs if attr not in names]
+        assert not missing_attrs, f"Missing parameters: {missing_attrs}"
     
     def test_parameter_types(self, wfirst_params):
         """Test parameter types are correct 🔍"""
-        assert isinstance(wfirst_params.R, (int, float))
-        assert isinstance(wfirst_params.nlens, int)
-        assert isinstance(wfirst_params.npix, int)
-        assert isinstance(wfirst_params.pixsize, (int, float))
-        assert isinstance(wfirst_params.pinhole, bool)
-        assert isinstance(wfirst_params.wavecalDir, str)
-        assert isinstance(wfirst_params.exportDir, str)
\ No newline at end of file
+        specs = [
+            ('R', (int, float)),
+            ('nlens', int),
+            ('npix', int),
+            ('pixsize', (int, float)),
+            ('pinhole', bool),
+            ('wavecalDir', str),
+            ('exportDir', str),
+        ]
+        bad = [(name, expected) for name, expected in specs
+               if not isinstance(getattr(wfirst_params, name), expected)]
+        assert not bad, f"Parameters with unexpected types: {bad}"
\ No newline at end of file
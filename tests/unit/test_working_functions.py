@@ -8,23 +8,24 @@ import pytest
 import numpy as np
 import os
 
+# (size name, npix, Nspec) variants shared by the flatfield and crosstalk tests
+PIPELINE_SIZES = [
+    pytest.param("small", 32, 5, id="small"),
+    pytest.param("medium", 64, 10, id="medium"),
+]
+
 
 class TestPixelSolution:
     """Test pixel solution generation 🎯"""
     
     @pytest.mark.working
     @pytest.mark.requires_data
-    def test_gen_pixel_solution(self, wfirst_params, reference_files_available):
+    def test_gen_pixel_solution(self, wfirst_params, reference_files_available, lamsol, psftool_copy):
         """Test generating pixel solutions ✨"""
-        from crispy.tools.locate_psflets import PSFLets
-        
-        psftool = PSFLets()
-        lamlist = np.loadtxt(wfirst_params.wavecalDir + "lamsol.dat")[:, 0]
-        allcoef = np.loadtxt(wfirst_params.wavecalDir + "lamsol.dat")[:, 1:]
+        lamlist, allcoef = lamsol
 
-        psftool.geninterparray(lamlist, allcoef)
-        psftool.genpixsol(wfirst_params, lamlist, allcoef)
-        psftool.savepixsol(outdir=wfirst_params.exportDir)
+        psftool_copy.genpixsol(wfirst_params, lamlist, allcoef)
+        psftool_copy.savepixsol(outdir=wfirst_params.exportDir)
         
         # Check that output file was created
         output_file = os.path.join(wfirst_params.exportDir, 'PSFloc.fits')
@@ -37,81 +38,39 @@ class TestFlatfieldCreation:
     @pytest.mark.working
     @pytest.mark.requires_data
     @pytest.mark.slow
-    def test_create_flatfield_small(self, wfirst_params, reference_files_available):
-        """Test creating a small polychromatic flatfield ⚡"""
-        from crispy.unitTests import testCreateFlatfield
-        
-        # Use small parameters for faster test
-        testCreateFlatfield(
-            wfirst_params,
-            pixsize=0.1,
-            npix=32,
-            pixval=1.0,
-            Nspec=5,
-            outname='test_flatfield_small.fits'
-        )
-        
-        # Check output file exists (though it may fail to write)
+    @pytest.mark.parametrize("size,npix,Nspec", PIPELINE_SIZES)
+    @pytest.mark.xdist_group("unittestsoutputs")  # Writes flatfield_input.fits
+    def test_create_flatfield(self, unit_test_funcs, wfirst_params, reference_files_available, size, npix, Nspec):
+        """Test creating a polychromatic flatfield ⚡"""
         # The test passes if no exceptions are thrown
-        assert True
-    
-    @pytest.mark.working 
-    @pytest.mark.requires_data
-    @pytest.mark.slow
-    def test_create_flatfield_medium(self, wfirst_params, reference_files_available):
-        """Test creating a medium-sized flatfield 🔆"""
-        from crispy.unitTests import testCreateFlatfield
-        
-        testCreateFlatfield(
+        unit_test_funcs.testCreateFlatfield(
             wfirst_params,
             pixsize=0.1,
-            npix=64,
+            npix=npix,
             pixval=1.0,
-            Nspec=10,
-            outname='test_flatfield_medium.fits'
+            Nspec=Nspec,
+            outname=f'test_flatfield_{size}.fits'
         )
-        
-        assert True
 
 
 class TestCrosstalkAnalysis:
     """Test crosstalk functionality 🔀"""
     
-    @pytest.mark.working
-    @pytest.mark.requires_data 
-    @pytest.mark.slow
-    def test_crosstalk_small(self, wfirst_params, reference_files_available):
-        """Test crosstalk analysis with small parameters ⚡"""
-        from crispy.unitTests import testCrosstalk
-        
-        testCrosstalk(
-            wfirst_params,
-            pixsize=0.1,
-            npix=32,
-            pixval=1.0,
-            Nspec=5,
-            outname='test_crosstalk_small.fits'
-        )
-        
-        assert True
-    
     @pytest.mark.working
     @pytest.mark.requires_data
-    @pytest.mark.slow  
-    def test_crosstalk_medium(self, wfirst_params, reference_files_available):
-        """Test crosstalk analysis with medium parameters 🔀"""
-        from crispy.unitTests import testCrosstalk
-        
-        testCrosstalk(
+    @pytest.mark.slow
+    @pytest.mark.parametrize("size,npix,Nspec", PIPELINE_SIZES)
+    @pytest.mark.xdist_group("unittestsoutputs")  # Writes crosstalk_input.fits
+    def test_crosstalk(self, unit_test_funcs, wfirst_params, reference_files_available, size, npix, Nspec):
+        """Test crosstalk analysis ⚡"""
+        unit_test_funcs.testCrosstalk(
             wfirst_params,
             pixsize=0.1,
-            npix=64,
+            npix=npix,
             pixval=1.0,
-            Nspec=10,
-            outname='test_crosstalk_medium.fits'
+            Nspec=Nspec,
+            outname=f'test_crosstalk_{size}.fits'
         )
-        
-        assert True
 
 
 class TestOptimalExtraction:
@@ -119,12 +78,10 @@ class TestOptimalExtraction:
     
     @pytest.mark.working
     @pytest.mark.requires_data
-    def test_optimal_extraction(self, wfirst_params, crispy_image, reference_files_available):
+    def test_optimal_extraction(self, unit_test_funcs, wfirst_params, crispy_image, reference_files_available):
         """Test optimal extraction algorithm ✨"""
-        from crispy.unitTests import testOptExt
-        
         # Use crispy_image fixture for consistent test data
-        outspec, outvar = testOptExt(wfirst_params, crispy_image, lensX=0, lensY=0)
+        outspec, outvar = unit_test_funcs.testOptExt(wfirst_params, crispy_image, lensX=0, lensY=0)
         
         # Check outputs are reasonable
         assert outspec is not None
@@ -135,13 +92,9 @@ class TestOptimalExtraction:
     
     @pytest.mark.working
     @pytest.mark.requires_data
-    def test_optimal_extraction_large_image(self, wfirst_params, large_sample_image_data, reference_files_available):
+    def test_optimal_extraction_large_image(self, unit_test_funcs, wfirst_params, large_image, reference_files_available):
         """Test optimal extraction with larger image 🔍"""
-        from crispy.tools.image import Image
-        from crispy.unitTests import testOptExt
-        
-        large_image = Image(data=large_sample_image_data)
-        outspec, outvar = testOptExt(wfirst_params, large_image, lensX=0, lensY=0)
+        outspec, outvar = unit_test_funcs.testOptExt(wfirst_params, large_image, lensX=0, lensY=0)
         
         assert outspec is not None
         assert outvar is not None
@@ -152,27 +105,24 @@ class TestReferenceData:
     """Test reference data availability and integrity 📚"""
     
     @pytest.mark.requires_data
-    def test_reference_files_exist(self, wfirst_params):
+    def test_reference_files_exist(self, wfirst_params, path_exists):
         """Test that required reference files exist 📁"""
-        assert os.path.exists(wfirst_params.wavecalDir)
+        assert path_exists[wfirst_params.wavecalDir]
         
         # Check key files
         lamsol_file = os.path.join(wfirst_params.wavecalDir, "lamsol.dat")
         psfloc_file = os.path.join(wfirst_params.wavecalDir, "PSFloc.fits")
         
-        assert os.path.exists(lamsol_file), f"Missing {lamsol_file}"
-        assert os.path.exists(psfloc_file), f"Missing {psfloc_file}"
+        assert path_exists[lamsol_file], f"Missing {lamsol_file}"
+        assert path_exists[psfloc_file], f"Missing {psfloc_file}"
     
     @pytest.mark.requires_data
-    def test_lamsol_data_format(self, wfirst_params):
+    def test_lamsol_data_format(self, lamsol):
         """Test that lamsol.dat has correct format 🔍"""
-        lamsol_file = os.path.join(wfirst_params.wavecalDir, "lamsol.dat")
-        
-        data = np.loadtxt(lamsol_file)
-        assert data.shape[0] > 0  # Has rows
-        assert data.shape[1] > 1  # Has wavelengths and coefficients
+        wavelengths, allcoef = lamsol
+        assert len(wavelengths) > 0  # Has rows
+        assert allcoef.shape[1] > 0  # Has wavelengths and coefficients
         
         # Check wavelengths are reasonable (in nm)
-        wavelengths = data[:, 0]
-        assert np.all(wavelengths > 400)  # > 400 nm
-        assert np.all(wavelengths < 1200)  # < 1200 nm
\ No newline at end of file
+        assert wavelengths.min() > 400  # > 400 nm
+        assert wavelengths.max() < 1200  # < 1200 nm
\ No newline at end of file